@@ -16,12 +16,18 @@
 
 import re
 import os
-from enum import Enum
+import string
+from array import array
+from enum import IntEnum
 import random
 from dotenv import load_dotenv
 
 load_dotenv()
 
+# Read the DEBUG flag once instead of consulting the environment on
+# every call to run
+_DEBUG = os.environ.get("DEBUG") == "1"
+
 # =================================================================================================
 #    ERRORS
 #
@@ -32,6 +38,8 @@ load_dotenv()
 #    @param details: The details of the error
 # =================================================================================================
 class Error:
+    __slots__ = ("error_name", "details")
+
     def __init__(self, error_name, details):
         self.error_name = error_name
         self.details = details
@@ -45,6 +53,8 @@ class Error:
 #    @param details: The details of the error
 # =================================================================================================
 class IllegalCharError(Error):
+    __slots__ = ()
+
     def __init__(self, details):
         super().__init__("Illegal Character", details)
 
@@ -54,6 +64,8 @@ class IllegalCharError(Error):
 #    @param details: The details of the error
 # =================================================================================================
 class InvalidSyntaxError(Error):
+    __slots__ = ()
+
     def __init__(self, details):
         super().__init__("Invalid Syntax", details)
 
@@ -66,127 +78,135 @@ class InvalidSyntaxError(Error):
 #    of tokens that can be found in the source code. Various constants
 #    are defined as specified per EBNF grammar.
 # =================================================================================================
-class TokenType(Enum):
-    TT_STR = "TT_STR"
-    TT_INT = "TT_INT"
-    TT_FLOAT = "TT_FLOAT"
-    TT_EOF = "TT_EOF"
-    TT_KEYWORD = "TT_KEYWORD"
+class TokenType(IntEnum):
+    # IntEnum so token type comparisons are C-level integer compares
+    TT_STR = 0
+    TT_INT = 1
+    TT_FLOAT = 2
+    TT_EOF = 3
+    TT_KEYWORD = 4
 
 
 WHITESPACE = " \t\n\r"
-LETTER = "abcdefghijklmnopqrstuvwxyzABCDEFGHIJKLMNOPQRSTUVWXYZ"
 DIGIT = "0123456789"
 DECIMAL_POINT = "."
-KEYWORDS = [
-    "DEPOSIT",
-    "WITHDRAW",
-    "BALANCE",
-    "CREATE",
-    "FIRSTNAME",
-    "LASTNAME",
-    "ACCOUNT",
-]
+KEYWORDS = frozenset(
+    [
+        "DEPOSIT",
+        "WITHDRAW",
+        "BALANCE",
+        "CREATE",
+        "FIRSTNAME",
+        "LASTNAME",
+        "ACCOUNT",
+    ]
+)
 ACCOUNT_NUMBER_FORMAT = "^[A-Z]{2}[0-9]{6}"
 
-# =================================================================================================
-#    TOKEN
-#
-#    The Token class is used to represent a token in the source code.
-#    A token consists of a type and a value.
-#
-#    @param type: The type of the token
-#    @param value: The value of the token
-# =================================================================================================
-class Token:
-    def __init__(self, type: TokenType, value: any):
-        self.type: TokenType = type
-        self.value = value
+# Precompiled scanners so the lexer can extract a whole run of characters
+# with a single C-level match and slice instead of a Python-level loop
+_WS_RE = re.compile("[" + WHITESPACE + "]+")
+_WORD_RE = re.compile(r"\S+")
+_NUMBER_RE = re.compile("[" + DIGIT + re.escape(DECIMAL_POINT) + "]+")
+_ACCOUNT_RE = re.compile(ACCOUNT_NUMBER_FORMAT)
 
-    def __str__(self):
-        return f"Token({self.type.value}, '{self.value}')"
-
-    def __repr__(self):
-        return self.__str__()
+# Dedicated generator for account numbers so ID generation doesn't go
+# through the shared module-global Random instance
+_rand_bits = random.Random().getrandbits
 
 # =================================================================================================
 #    LEXER
 #
 #    The Lexer class is used to tokenize the source code.
-#    It reads the source code character by character and
-#    creates tokens based on the characters it reads.
+#    The token stream is kept as two parallel columns -- a list of token
+#    types and a list of token values -- instead of a list of token
+#    objects, so consumers index two flat lists rather than chasing a
+#    pointer per token. The scanning loop itself lives in the module-level
+#    _lex_raw function, which works only on local variables and module
+#    constants so the hot path does no per-token attribute loads (and
+#    could be compiled as an extension module without touching the rest
+#    of the file).
 #
 #    @param source: The source code to tokenize
 # =================================================================================================
+
+# Scan a word starting at index
+# @return: The token type and value, the index after the word, and an error if one occurred
+def _scan_word(source, index) -> tuple[TokenType, str, int, Error]:
+    # A word runs to the next whitespace; extract it with one match + slice
+    match = _WORD_RE.match(source, index)
+    word = match.group()
+    if word in KEYWORDS:
+        return TokenType.TT_KEYWORD, word, match.end(), None
+    return TokenType.TT_STR, word, match.end(), None
+
+# Scan a number starting at index
+# @return: The token type and value, the index after the number, and an error if one occurred
+def _scan_number(source, index) -> tuple[TokenType, any, int, Error]:
+    # A number is a run of digits and decimal points; extract it with
+    # one match + slice
+    match = _NUMBER_RE.match(source, index)
+    number = match.group()
+    if number.count(DECIMAL_POINT) > 1:
+        return None, None, match.end(), IllegalCharError("More than one decimal point in number")
+    if DECIMAL_POINT in number:
+        return TokenType.TT_FLOAT, float(number), match.end(), None
+    else:
+        return TokenType.TT_INT, int(number), match.end(), None
+
+# Dispatch table mapping an ASCII code point to the scanner for tokens that
+# start with that character; anything left as None is an illegal character
+_DISPATCH = [None] * 128
+for _char in string.ascii_letters:
+    _DISPATCH[ord(_char)] = _scan_word
+for _char in DIGIT + DECIMAL_POINT:
+    _DISPATCH[ord(_char)] = _scan_number
+del _char
+
+# Tokenize the source code
+# @return: The token type and value columns and an error if one occurred
+def _lex_raw(source: str) -> tuple[array, list, Error]:
+    # The type column is a compact byte array (TokenType values fit in a
+    # byte); the value column stays a list since it holds mixed payloads
+    types = array("b")
+    values = []
+    # Bind the append methods once so the loop skips the attribute lookup
+    append_type = types.append
+    append_value = values.append
+    index = 0
+    length = len(source)
+    while True:
+        # Skip a whole run of whitespace with a single match
+        match = _WS_RE.match(source, index)
+        if match:
+            index = match.end()
+        if index >= length:
+            break
+        # One table load picks the scanner for this character instead of
+        # testing each character class in turn
+        code = ord(source[index])
+        scanner = _DISPATCH[code] if code < 128 else None
+        if scanner is None:
+            return array("b"), [], IllegalCharError(source[index])
+        type, value, index, error = scanner(source, index)
+        if error:
+            return array("b"), [], error
+        append_type(type)
+        append_value(value)
+
+    return types, values, None
+
 class Lexer:
     def __init__(self, source):
         self.source = source
-        self.current_char = None
-        self.index = -1
-        self.tokens = []
-
-    # Advance the index and set the current character
-    def advance(self):
-        self.index += 1
-        if self.index < len(self.source):
-            self.current_char = self.source[self.index]
-        else:
-            self.current_char = None
+        self.types = array("b")
+        self.values = []
 
     # Tokenize the source code
-    # @return: The tokens and an error if one occurred
-    def lex(self) -> tuple[list[Token], Error]:
-        self.advance()
-        while self.index < len(self.source):
-            if self.current_char in WHITESPACE:
-                self.advance()
-            elif self.current_char in LETTER:
-                token, error = self.lex_word()
-                if error:
-                    return [], error
-                self.tokens.append(token)
-            elif self.current_char in DIGIT + DECIMAL_POINT:
-                token, error = self.lex_number()
-                if error:
-                    return [], error
-                self.tokens.append(token)
-            else:
-                return [], IllegalCharError(self.current_char)
-            self.advance()
-
-        return self.tokens, None
-
-    # Tokenize a word
-    # @return: The word token and an error if one occurred
-    def lex_word(self) -> tuple[Token, Error]:
-        word = ""
-        while self.current_char is not None and self.current_char not in WHITESPACE:
-            word += self.current_char
-            self.advance()
-        if word in KEYWORDS:
-            return Token(TokenType.TT_KEYWORD, word), None
-        return Token(TokenType.TT_STR, word), None
-
-    # Tokenize a number
-    # @return: The number token and an error if one occurred
-    def lex_number(self) -> tuple[Token, Error]:
-        number = ""
-        decimal_count = 0
-        while (
-            self.current_char is not None
-            and self.current_char not in WHITESPACE
-            and self.current_char in DIGIT + DECIMAL_POINT
-        ):
-            if self.current_char == DECIMAL_POINT:
-                decimal_count += 1
-                if decimal_count > 1:
-                    return None, IllegalCharError("More than one decimal point in number")
-            number += self.current_char
-            self.advance()
-        if "." in number:
-            return Token(TokenType.TT_FLOAT, float(number)), None
-        else:
-            return Token(TokenType.TT_INT, int(number)), None
+    # @return: The token type and value columns and an error if one occurred
+    def lex(self) -> tuple[array, list, Error]:
+        self.types, self.values, error = _lex_raw(self.source)
+        return self.types, self.values, error
 
 # =================================================================================================
 #    NODES (AST)
@@ -195,7 +215,7 @@ class Lexer:
 #    that can be found in the Abstract Syntax Tree (AST).
 # =================================================================================================
 class Node:
-    pass
+    __slots__ = ()
 
 # =================================================================================================
 #    CREATE NODE
@@ -209,11 +229,13 @@ class Node:
 #    @param account_identifier: The account identifier of the account
 # =================================================================================================
 class CreateNode(Node):
+    __slots__ = ("firstname", "lastname", "account_identifier", "balance")
+
     def __init__(
         self,
         firstname,
         lastname,
-        balance=Token(TokenType.TT_INT, 0),
+        balance=0,
         account_identifier=None,
     ):
         self.firstname = firstname
@@ -227,12 +249,8 @@ class CreateNode(Node):
     # @return: The account identifier
     def build_account_identifier(self):
         # First letter of the first name and first letter of the last name and 6 random digits
-        return Token(
-            TokenType.TT_STR,
-            self.firstname.value[0]
-            + self.lastname.value[0]
-            + str(random.randint(100000, 999999)),
-        )
+        suffix = 100000 + _rand_bits(20) % 900000
+        return f"{self.firstname[0]}{self.lastname[0]}{suffix}"
 
     def __repr__(self):
         return (
@@ -249,6 +267,8 @@ class CreateNode(Node):
 #    @param amount: The amount to deposit
 # =================================================================================================
 class DepositNode(Node):
+    __slots__ = ("account_identifier", "amount")
+
     def __init__(self, account_identifier, amount):
         self.account_identifier = account_identifier
         self.amount = amount
@@ -266,6 +286,8 @@ class DepositNode(Node):
 #   @param amount: The amount to withdraw
 # =================================================================================================
 class WithdrawNode(Node):
+    __slots__ = ("account_identifier", "amount")
+
     def __init__(self, account_identifier, amount):
         self.account_identifier = account_identifier
         self.amount = amount
@@ -282,6 +304,8 @@ class WithdrawNode(Node):
 #   @param account_identifier: The account identifier to check the balance of
 # =================================================================================================
 class BalanceNode(Node):
+    __slots__ = ("account_identifier",)
+
     def __init__(self, account_identifier):
         self.account_identifier = account_identifier
 
@@ -291,163 +315,172 @@ class BalanceNode(Node):
 # =================================================================================================
 #   PARSER
 #
-#   The Parser class is used to parse the tokens and build the AST.
+#   The Parser class is used to parse the token columns and build the AST.
+#   Node fields hold the plain token values (strings and numbers), not
+#   token objects.
 # =================================================================================================
 class Parser:
-    def __init__(self, tokens):
-        self.tokens = tokens
-        self.current_token = None
+    def __init__(self, types, values):
+        self.types = types
+        self.values = values
+        self.current_type = None
+        self.current_value = None
         self.index = -1
-
-    # Advance the index and set the current token
+        # One dict lookup picks the statement parser instead of comparing
+        # the keyword against each candidate in turn
+        self._statement_parsers = {
+            "CREATE": self.parse_create,
+            "DEPOSIT": self.parse_deposit,
+            "WITHDRAW": self.parse_withdraw,
+            "BALANCE": self.parse_balance,
+        }
+
+    # Advance the index and set the current token type and value
     def advance(self):
         self.index += 1
-        if self.index < len(self.tokens):
-            self.current_token = self.tokens[self.index]
+        if self.index < len(self.types):
+            self.current_type = self.types[self.index]
+            self.current_value = self.values[self.index]
         else:
-            self.current_token = None
+            self.current_type = None
+            self.current_value = None
 
     # Parse the tokens
     # @return: The AST and an InvalidSyntaxError if one occurred
     def parse(self):
         statements = []
         self.advance()
-        while self.current_token is not None:
-            statement = self.parse_statement()
-            if type(statement) == InvalidSyntaxError:
-                return [], statement
+        while self.current_type is not None:
+            statement, error = self.parse_statement()
+            if error is not None:
+                return [], error
             statements.append(statement)
             self.advance()
         return statements, None
 
     # Parse a statement
-    # @return: A statement node or an InvalidSyntaxError
+    # @return: A statement node and an InvalidSyntaxError if one occurred
     def parse_statement(self):
-        if self.current_token.type == TokenType.TT_KEYWORD:
-            if self.current_token.value == "CREATE":
-                return self.parse_create()
-            elif self.current_token.value == "DEPOSIT":
-                return self.parse_deposit()
-            elif self.current_token.value == "WITHDRAW":
-                return self.parse_withdraw()
-            elif self.current_token.value == "BALANCE":
-                return self.parse_balance()
-        return InvalidSyntaxError(
+        if self.current_type == TokenType.TT_KEYWORD:
+            parser = self._statement_parsers.get(self.current_value)
+            if parser is not None:
+                return parser()
+        return None, InvalidSyntaxError(
             "Expected keyword CREATE, DEPOSIT, WITHDRAW, or BALANCE"
         )
 
     # Parse a DEPOSIT statement
-    # @return: The DEPOSIT node
+    # @return: The DEPOSIT node and an InvalidSyntaxError if one occurred
     def parse_deposit(self):
         self.advance()
-        if self.current_token is None or self.current_token.type != TokenType.TT_STR:
-            return InvalidSyntaxError("Expected a string")
-        account_identifier = self.current_token
+        if self.current_type is None or self.current_type != TokenType.TT_STR:
+            return None, InvalidSyntaxError("Expected a string")
+        account_identifier = self.current_value
 
         self.advance()
-        if self.current_token is None and (
-            self.current_token.type != TokenType.TT_FLOAT
-            or self.current_token.type != TokenType.TT_INT
+        if self.current_type is None and (
+            self.current_type != TokenType.TT_FLOAT
+            or self.current_type != TokenType.TT_INT
         ):
-            return InvalidSyntaxError("Expected a number")
-        amount = self.current_token
-        return DepositNode(account_identifier, amount)
+            return None, InvalidSyntaxError("Expected a number")
+        amount = self.current_value
+        return DepositNode(account_identifier, amount), None
 
     # Parse a WITHDRAW statement
-    # @return: The WITHDRAW node
+    # @return: The WITHDRAW node and an InvalidSyntaxError if one occurred
     def parse_withdraw(self):
         self.advance()
-        if self.current_token is None or self.current_token.type != TokenType.TT_STR:
-            return InvalidSyntaxError("Expected a string")
-        account_identifier = self.current_token
+        if self.current_type is None or self.current_type != TokenType.TT_STR:
+            return None, InvalidSyntaxError("Expected a string")
+        account_identifier = self.current_value
 
         self.advance()
-        if self.current_token is None and (
-            self.current_token.type != TokenType.TT_FLOAT
-            or self.current_token.type != TokenType.TT_INT
+        if self.current_type is None and (
+            self.current_type != TokenType.TT_FLOAT
+            or self.current_type != TokenType.TT_INT
         ):
-            return InvalidSyntaxError("Expected a number")
-        amount = self.current_token
-        return WithdrawNode(account_identifier, amount)
+            return None, InvalidSyntaxError("Expected a number")
+        amount = self.current_value
+        return WithdrawNode(account_identifier, amount), None
 
     # Parse a BALANCE statement
-    # @return: The BALANCE node
+    # @return: The BALANCE node and an InvalidSyntaxError if one occurred
     def parse_balance(self):
         self.advance()
-        if self.current_token.type == TokenType.TT_STR:
-            account_identifier = self.current_token
+        if self.current_type == TokenType.TT_STR:
+            account_identifier = self.current_value
         else:
-            return InvalidSyntaxError("Expected a string")
+            return None, InvalidSyntaxError("Expected a string")
         # Validate the account number format
-        if not re.match(ACCOUNT_NUMBER_FORMAT, account_identifier.value):
-            return InvalidSyntaxError("Invalid account number format. Should be XX123456")
+        if not _ACCOUNT_RE.match(account_identifier):
+            return None, InvalidSyntaxError("Invalid account number format. Should be XX123456")
 
-        return BalanceNode(account_identifier)
+        return BalanceNode(account_identifier), None
 
     # Parse a CREATE statement
-    # @return: The CREATE node
+    # @return: The CREATE node and an InvalidSyntaxError if one occurred
     def parse_create(self):
         # Check if the next token is the keyword FIRSTNAME
         self.advance()
-        if self.current_token is None or (
-            self.current_token.type != TokenType.TT_KEYWORD
-            and self.current_token.value != "FIRSTNAME"
+        if self.current_type is None or (
+            self.current_type != TokenType.TT_KEYWORD
+            and self.current_value != "FIRSTNAME"
         ):
-            return InvalidSyntaxError("Expected keyword FIRSTNAME")
+            return None, InvalidSyntaxError("Expected keyword FIRSTNAME")
         self.advance()
 
         # Check if the next token is a string, this will represent the first name
-        if self.current_token is None and self.current_token.type == TokenType.TT_STR:
-            return InvalidSyntaxError("Expected a string")
-        first_name = self.current_token
+        if self.current_type is None and self.current_type == TokenType.TT_STR:
+            return None, InvalidSyntaxError("Expected a string")
+        first_name = self.current_value
         self.advance()
 
         # Check if the next token is the keyword LASTNAME
-        if self.current_token is None or (
-            self.current_token.type != TokenType.TT_KEYWORD
-            and self.current_token.value != "LASTNAME"
+        if self.current_type is None or (
+            self.current_type != TokenType.TT_KEYWORD
+            and self.current_value != "LASTNAME"
         ):
-            return InvalidSyntaxError("Expected the keyword LASTNAME")
+            return None, InvalidSyntaxError("Expected the keyword LASTNAME")
         self.advance()
 
         # Check if the next token is a string, this will represent the last name
-        if self.current_token is None and self.current_token.type == TokenType.TT_STR:
-            return InvalidSyntaxError("Expected a string")
-        last_name = self.current_token
+        if self.current_type is None and self.current_type == TokenType.TT_STR:
+            return None, InvalidSyntaxError("Expected a string")
+        last_name = self.current_value
 
         # Check for optional keywords BALANCE and ACCOUNT
-        balance = Token(TokenType.TT_INT, 0)
+        balance = 0
         account_identifier = None
 
         self.advance()
-        while self.current_token is not None:
-            if self.current_token.type == TokenType.TT_KEYWORD:
+        while self.current_type is not None:
+            if self.current_type == TokenType.TT_KEYWORD:
                 # Should be either BALANCE or ACCOUNT
-                if self.current_token.value == "BALANCE":
+                if self.current_value == "BALANCE":
                     # Check if the next token is a number, return SyntaxError if not
                     self.advance()
                     if (
-                        self.current_token.type == TokenType.TT_INT
-                        or self.current_token.type == TokenType.TT_FLOAT
+                        self.current_type == TokenType.TT_INT
+                        or self.current_type == TokenType.TT_FLOAT
                     ):
-                        balance = self.current_token
+                        balance = self.current_value
                     else:
-                        return InvalidSyntaxError("Expected a number")
-                elif self.current_token.value == "ACCOUNT":
+                        return None, InvalidSyntaxError("Expected a number")
+                elif self.current_value == "ACCOUNT":
                     # Check if the next token is a string, return SyntaxError if not
                     self.advance()
-                    if self.current_token.type == TokenType.TT_STR:
+                    if self.current_type == TokenType.TT_STR:
                         # Check if the account number is in the correct format
-                        if re.match(ACCOUNT_NUMBER_FORMAT, self.current_token.value):
-                            account_identifier = self.current_token
+                        if _ACCOUNT_RE.match(self.current_value):
+                            account_identifier = self.current_value
                         else:
-                            return InvalidSyntaxError("Invalid account number format")
+                            return None, InvalidSyntaxError("Invalid account number format")
                     else:
-                        return InvalidSyntaxError("Expected a string")
+                        return None, InvalidSyntaxError("Expected a string")
 
             self.advance()
 
-        return CreateNode(first_name, last_name, balance, account_identifier)
+        return CreateNode(first_name, last_name, balance, account_identifier), None
 
 # =================================================================================================
 #    ACCOUNT TABLE
@@ -458,25 +491,27 @@ class AccountTable:
     def __init__(self):
         self.accounts = {}
 
-    # Add an account to the account table
+    # Add an account to the account table. If the account number is already
+    # taken, pick a new one and try again (bounded) instead of dropping the
+    # account on the floor
     # @param account: The account to add
-    # @return: The account that was added
-    def add_account(self, account):
-        result = self.get_account(account.account_identifier.value)
-        if not result:
-            self.accounts[account.account_identifier.value] = account
-            return account
-
-        return "Account already exists... picking a new account number"
+    # @param max_tries: How many account numbers to try before giving up
+    # @return: The account that was added, or None if no account number was free
+    def add_account(self, account, max_tries=8):
+        for _ in range(max_tries):
+            # One dict probe covers both the existence check and the insert
+            account_identifier = account.account_identifier
+            if account_identifier not in self.accounts:
+                self.accounts[account_identifier] = account
+                return account
+            account.account_identifier = account.build_account_identifier()
+        return None
 
     # Get an account from the account table
     # @param account_identifier: The account identifier to search for
     # @return: The account if it exists, otherwise None
     def get_account(self, account_identifier):
-        if account_identifier in self.accounts:
-            return self.accounts[account_identifier]
-        else:
-            return None
+        return self.accounts.get(account_identifier)
 
 # =================================================================================================
 #   INTERPRETER
@@ -488,48 +523,68 @@ class AccountTable:
 class Interpreter:
     def __init__(self, account_table):
         self.account_table = account_table
+        # Resolve the visitor for each node type once, instead of building
+        # a method name and calling getattr for every node
+        self._visitors = {
+            CreateNode: self.visit_CreateNode,
+            DepositNode: self.visit_DepositNode,
+            WithdrawNode: self.visit_WithdrawNode,
+            BalanceNode: self.visit_BalanceNode,
+        }
 
     # Interpret the AST
     # @param statements: Array of statements to interpret
+    # @return: The results of all statements joined into a single string,
+    #          so the caller prints once per batch instead of per statement
     def interpret(self, statements):
+        results = []
         for statement in statements:
-            return self.visit(statement)
+            results.append(self.visit(statement))
+        if not results:
+            return None
+        return "\n".join(results)
 
     # Visit a node
     # @param node: The node to visit
     def visit(self, node):
-        method_name = f"visit_{type(node).__name__}"
-        method = getattr(self, method_name)
-        return method(node)
+        return self._visitors[type(node)](node)
 
     # Visit a CREATE node and add the account to the account table
     # @param node: The CREATE node\
     # @return: A string indicating the result of the account creation
     def visit_CreateNode(self, node) -> str:
-        self.account_table.add_account(node)
-        return f"Account created: {node.account_identifier.value}" 
+        account = self.account_table.add_account(node)
+        if account is None:
+            return "Unable to create account: no free account number"
+        return f"Account created: {account.account_identifier}"
 
     # Visit a DEPOSIT node and update the account balance
     # @param node: The DEPOSIT node
     # @return: A string indicating the result of the deposit
     def visit_DepositNode(self, node: DepositNode) -> str:
-        account = self.account_table.get_account(node.account_identifier.value)
+        # Bind the node fields once instead of re-reading the attributes
+        aid = node.account_identifier
+        amount = node.amount
+        account = self.account_table.get_account(aid)
         if account:
-            account.balance.value += node.amount.value
-            return f"Deposit of ${node.amount.value} into account {node.account_identifier.value} successful"
+            account.balance += amount
+            return f"Deposit of ${amount} into account {aid} successful"
         return "Account not found"
 
     # Visit a WITHDRAW node and update the account balance
     # @param node: The WITHDRAW node
     # @return: A string indicating the result of the withdrawal
     def visit_WithdrawNode(self, node: WithdrawNode) -> str:
-        account = self.account_table.get_account(node.account_identifier.value)
+        # Bind the node fields once instead of re-reading the attributes
+        aid = node.account_identifier
+        amount = node.amount
+        account = self.account_table.get_account(aid)
         if account:
-            if account.balance.value < node.amount.value:
-                return f"Insufficient funds in account {node.account_identifier.value}"
+            if account.balance < amount:
+                return f"Insufficient funds in account {aid}"
             else:
-                account.balance.value -= node.amount.value
-                return f"Withdrawal of ${node.amount.value} from account {node.account_identifier.value} successful"
+                account.balance -= amount
+                return f"Withdrawal of ${amount} from account {aid} successful"
         else:
             return "Account not found"
 
@@ -537,9 +592,11 @@ class Interpreter:
     # @param node: The BALANCE node
     # @return: A string indicating the account balance
     def visit_BalanceNode(self, node: BalanceNode) -> str:
-        account = self.account_table.get_account(node.account_identifier.value)
+        # Bind the node field once instead of re-reading the attribute
+        aid = node.account_identifier
+        account = self.account_table.get_account(aid)
         if account:
-            return f"Balance for account {node.account_identifier.value}: ${account.balance.value}"
+            return f"Balance for account {aid}: ${account.balance}"
         else:
             return "Account not found"
 
@@ -557,16 +614,16 @@ def run(stream):
     lexer = Lexer(stream)
 
     # Tokenize the source code
-    tokens, error = lexer.lex()
+    types, values, error = lexer.lex()
 
     # Return an error if one occurred
     if error:
         return error
-    if os.getenv("DEBUG") == "1":
-        print(tokens)
+    if _DEBUG:
+        print([(TokenType(type).name, value) for type, value in zip(types, values)])
 
     # Initialize the parser
-    parser = Parser(tokens)
+    parser = Parser(types, values)
 
     # Parse the tokens and build the AST
     ast, error = parser.parse()
@@ -574,7 +631,7 @@ def run(stream):
     # Return an error if one occurred
     if error:
         return error
-    if os.getenv("DEBUG") == "1":
+    if _DEBUG:
         print(ast)
 
     # Initialize the interpreter
@@ -13,8 +13,15 @@
 # =================================================================================================
 
 import src.banking as banking
+import pytest
 import re
 
+# Each test starts with an empty account table, so accounts created in one
+# test cannot collide with the accounts of another
+@pytest.fixture(autouse=True)
+def fresh_account_table():
+    banking.global_account_table.accounts.clear()
+
 def test_create_account():
     # It should return a string with the account number
     syntax = "CREATE FIRSTNAME John LASTNAME Doe BALANCE 1000 ACCOUNT JD123456"